@@ -1,5 +1,10 @@
 import sys
 import os
+import io
+import gc
+import csv
+import re
+import fnmatch
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -15,9 +20,22 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import webbrowser
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # Only public from pandas 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QPushButton, QLineEdit, QLabel,
+    QTableView, QPushButton, QLineEdit, QLabel,
     QComboBox, QDateTimeEdit, QSpinBox, QCheckBox, QTabWidget,
     QTextEdit, QProgressBar, QFileDialog, QMessageBox, QSplitter,
     QGroupBox, QGridLayout, QTreeWidget, QTreeWidgetItem, QFrame,
@@ -25,40 +43,178 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import (
     Qt, QThread, pyqtSignal, QTimer, QDateTime, QAbstractTableModel,
-    QModelIndex, QSortFilterProxyModel
+    QModelIndex, QObject, QRunnable, QThreadPool,
+    QMutex, QMutexLocker
 )
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
+from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QBrush
+
+# String columns that MFTECmd repeats across most records
+CATEGORY_COLUMNS = ['ParentPath', 'Extension', 'SiFlags', 'NameType', 'SourceFile']
+
+# MFTECmd flag columns, stored as plain bool so counts are a single sum
+BOOL_COLUMNS = ['InUse', 'IsDirectory', 'HasAds', 'IsAds', 'Copied', 'SI<FN', 'uSecZeros']
+
+# Rows serialized per write when exporting, bounding the text held in memory
+EXPORT_CHUNK_ROWS = 100_000
+
+# Rows bound per executemany when writing the SQLite copy
+DB_CHUNK_ROWS = 50_000
+
+# String columns that are (nearly) unique per record and never worth categorizing
+UNIQUE_COLUMNS = ['FullPath']
+
+# Column names that hold MFT timestamps (Created0x10, LastAccess0x30, ...)
+TIMESTAMP_COLUMN_RE = re.compile(r'created|modified|access|change', re.IGNORECASE)
+
+def timestamp_columns(columns):
+    """Return the column names that hold timestamps"""
+    return [col for col in columns if TIMESTAMP_COLUMN_RE.search(col)]
+
+# Timestamp layouts probed before falling back to per-value format inference
+TIMESTAMP_FORMATS = [
+    '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S',
+    '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %I:%M:%S %p',
+]
+
+def sniff_timestamp_format(sample):
+    """Return the first known format that parses sample, else pandas' guess, or None"""
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            pd.to_datetime([sample], format=fmt)
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    return guess_datetime_format(sample)
+
+def parse_timestamps(series):
+    """Parse series to datetime64 with its sniffed format, inferring per value only as a fallback"""
+    first = series.first_valid_index()
+    fmt = sniff_timestamp_format(str(series.at[first])) if first is not None else None
+    if fmt is not None:
+        parsed = pd.to_datetime(series, format=fmt, errors='coerce', cache=True)
+        if parsed.notna().any():
+            # Values in another layout get the per-value parser instead of becoming NaT
+            missed = parsed.isna() & series.notna()
+            if missed.any():
+                parsed[missed] = pd.to_datetime(series[missed], errors='coerce', cache=True)
+            return parsed
+    return pd.to_datetime(series, errors='coerce', cache=True)
+
+def minmax_downsample(x, y, n_out=2000):
+    """Reduce a series to about n_out points, keeping each bucket's minimum and maximum"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(y) <= n_out:
+        return x, y
+    
+    # Peaks and troughs survive, so spikes in activity stay visible
+    edges = np.linspace(0, len(y), n_out // 2 + 1).astype(int)
+    keep = [0, len(y) - 1]
+    for start, stop in zip(edges[:-1], edges[1:]):
+        bucket = y[start:stop]
+        keep.append(start + int(bucket.argmin()))
+        keep.append(start + int(bucket.argmax()))
+    keep = np.unique(keep)
+    return x[keep], y[keep]
+
+def is_low_cardinality(values, max_unique, sample_size=200_000):
+    """Return True if values has fewer than max_unique distinct entries"""
+    if len(values) > sample_size:
+        # A strided sample that is already mostly unique rules out the full hash
+        step = len(values) // sample_size
+        if pd.unique(values[::step]).size >= sample_size // 2:
+            return False
+    return pd.unique(values).size < max_unique
+
+def sql_column_values(series):
+    """Return series as a list of SQLite-ready Python values, with None for missing"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        # Converted in bulk rather than by sqlite3's per-value datetime adapter
+        if HAS_PYARROW:
+            arr = pa.array(series).cast(pa.timestamp('us'), safe=False).cast(pa.string())
+            return arr.to_numpy(zero_copy_only=False).tolist()
+        text = series.dt.strftime('%Y-%m-%d %H:%M:%S.%f')
+        return text.astype(object).where(series.notna(), None).tolist()
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return series.tolist()
+    values = series.to_numpy(dtype=object)
+    values[pd.isna(values)] = None
+    return values.tolist()
 
 class MFTTableModel(QAbstractTableModel):
     """Optimized table model for large datasets"""
     
-    def __init__(self, data=None):
+    def __init__(self, data=None, columns=None):
         super().__init__()
-        self._data = data if data is not None else pd.DataFrame()
-        self._headers = list(self._data.columns) if not self._data.empty else []
+        self._deleted_brush = QBrush(QColor(255, 200, 200))  # Light red for deleted
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._set_data(data if data is not None else pd.DataFrame(), columns)
+    
+    def _set_data(self, data, columns=None):
+        self._source = data
+        self._headers = list(columns) if columns is not None else list(data.columns)
+        self._apply_sort()
+    
+    def _apply_sort(self):
+        """Compute the view's row order over the source rows and rebuild the caches"""
+        data = self._source
+        # Positions into the source, in display order; None while the order is the identity.
+        # The source itself is never reordered, so the model holds no copy of the frame.
+        self._order = None
+        if 0 <= self._sort_column < len(self._headers) and len(data) > 1:
+            key = data[self._headers[self._sort_column]].reset_index(drop=True)
+            if isinstance(key.dtype, pd.CategoricalDtype) and not key.cat.categories.is_monotonic_increasing:
+                # Sort categoricals by label, not by first-seen category order
+                key = key.cat.reorder_categories(key.cat.categories.sort_values())
+            ascending = self._sort_order == Qt.AscendingOrder
+            try:
+                in_order = key.is_monotonic_increasing if ascending else key.is_monotonic_decreasing
+            except TypeError:
+                in_order = False
+            if not in_order:
+                try:
+                    order = key.sort_values(ascending=ascending, kind='stable', na_position='last').index
+                except TypeError:
+                    order = key.map(str, na_action='ignore').sort_values(
+                        ascending=ascending, kind='stable', na_position='last'
+                    ).index
+                self._order = order.to_numpy()
+        self._row_count = len(data)
+        
+        # Cache one array per displayed column (views of the source) so data() skips DataFrame indexing
+        self._columns = [
+            data[col].to_numpy() if data[col].dtype.kind in 'biufO' else data[col].array
+            for col in self._headers
+        ]
+        self._deleted = ~data['InUse'].to_numpy(dtype=bool) if 'InUse' in data.columns else None
+    
+    def _source_row(self, row):
+        """Map a view row to its position in the source frame"""
+        return row if self._order is None else self._order[row]
         
     def rowCount(self, parent=QModelIndex()):
-        return len(self._data)
+        return self._row_count
     
     def columnCount(self, parent=QModelIndex()):
         return len(self._headers)
     
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid() or not (0 <= index.row() < len(self._data)):
+        row = index.row()
+        if not index.isValid() or not (0 <= row < self._row_count):
             return None
             
         if role == Qt.DisplayRole:
-            value = self._data.iloc[index.row(), index.column()]
+            value = self._columns[index.column()][self._source_row(row)]
             if pd.isna(value):
                 return ""
             return str(value)
         
         elif role == Qt.BackgroundRole:
             # Highlight deleted files based on InUse flag
-            if 'InUse' in self._headers:
-                inuse_col = self._headers.index('InUse')
-                if not self._data.iloc[index.row(), inuse_col]:
-                    return QColor(255, 200, 200)  # Light red for deleted
+            if self._deleted is not None and self._deleted[self._source_row(row)]:
+                return self._deleted_brush
         
         return None
     
@@ -67,77 +223,217 @@ class MFTTableModel(QAbstractTableModel):
             return self._headers[section] if section < len(self._headers) else ""
         return None
     
-    def update_data(self, new_data):
+    def update_data(self, new_data, columns=None):
+        """Swap in a new DataFrame, optionally showing only a subset of its columns"""
+        headers = list(columns) if columns is not None else list(new_data.columns)
+        if new_data is self._source and headers == self._headers:
+            return  # Same rows and columns already shown; skip the reset and re-sort
+        self.beginResetModel()
+        self._set_data(new_data, columns)
+        self.endResetModel()
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort with pandas on the real column values instead of Qt comparing display strings"""
         self.beginResetModel()
-        self._data = new_data
-        self._headers = list(new_data.columns) if not new_data.empty else []
+        self._sort_column = column
+        self._sort_order = order
+        self._apply_sort()
         self.endResetModel()
+    
+    def row_data(self, row):
+        """Return the full record shown at a view row"""
+        return self._source.iloc[self._source_row(row)]
+
+class ProgressFile(io.FileIO):
+    """Read-only binary file that reports its offset after every read"""
+    
+    def __init__(self, path, callback):
+        super().__init__(path, 'rb')
+        self._callback = callback
+    
+    def read(self, size=-1):
+        data = super().read(size)
+        self._callback(self.tell())
+        return data
 
-class DataLoader(QThread):
-    """Background thread for loading large CSV files"""
+class DataLoaderSignals(QObject):
+    """Signals for DataLoader, since a QRunnable cannot emit its own"""
     progress = pyqtSignal(int)
     finished = pyqtSignal(pd.DataFrame)
     error = pyqtSignal(str)
+
+class DataLoader(QRunnable):
+    """Background task for loading large CSV files on the shared thread pool"""
     
     def __init__(self, file_path, chunk_size=10000):
         super().__init__()
+        self.signals = DataLoaderSignals()
         self.file_path = file_path
         self.chunk_size = chunk_size
+        self._last_percent = -1
         
     def run(self):
         try:
-            # Get total file size for progress calculation
-            file_size = os.path.getsize(self.file_path)
-            chunks = []
-            bytes_read = 0
-            
-            # Read in chunks with progress updates
-            for chunk in pd.read_csv(self.file_path, chunksize=self.chunk_size):
-                chunks.append(chunk)
-                bytes_read += len(chunk) * 100  # Approximate bytes
-                progress_percent = min(int((bytes_read / file_size) * 100), 99)
-                self.progress.emit(progress_percent)
-            
-            # Combine all chunks
-            df = pd.concat(chunks, ignore_index=True)
+            if HAS_PYARROW:
+                df = self.read_pyarrow()
+            else:
+                df = self.read_chunked()
             
             # Data preprocessing and optimization
             df = self.preprocess_data(df)
             
-            self.progress.emit(100)
-            self.finished.emit(df)
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(df)
             
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+    
+    def report_progress(self, position, file_size):
+        """Emit progress only when the whole-percent value changes"""
+        percent = min(position * 100 // file_size, 99)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.signals.progress.emit(percent)
+    
+    def read_pyarrow(self):
+        """Parse the whole file in one pass with pyarrow's multithreaded reader"""
+        file_size = max(os.path.getsize(self.file_path), 1)
+        
+        # Keep empty cells as missing values, matching pd.read_csv, and dictionary-encode
+        # the repetitive string columns so they arrive as categoricals
+        column_types = {col: pa.dictionary(pa.int32(), pa.string()) for col in CATEGORY_COLUMNS}
+        # Timestamps stay text: Arrow's own inference wraps or rejects values outside the
+        # datetime64[ns] range (e.g. 1601-01-01), which parse_timestamps turns into NaT
+        column_types.update({col: pa.string() for col in timestamp_columns(self.read_header())})
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True, column_types=column_types)
+        with ProgressFile(self.file_path, lambda pos: self.report_progress(pos, file_size)) as fh:
+            table = pa_csv.read_csv(fh, convert_options=convert_options)
+        # Hand column buffers to pandas one at a time instead of copying the whole table
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+        return df
+    
+    def read_header(self):
+        """Return the column names from the file's first line"""
+        with open(self.file_path, newline='', encoding='utf-8-sig', errors='replace') as fh:
+            return next(csv.reader(fh), [])
+    
+    def read_chunked(self):
+        """Fallback reader used when pyarrow is not installed"""
+        chunks = []
+        with open(self.file_path, 'rb') as fh:
+            file_size = max(os.fstat(fh.fileno()).st_size, 1)
+            
+            # Read in chunks, reporting the parser's real byte offset
+            for chunk in pd.read_csv(fh, chunksize=self.chunk_size):
+                chunks.append(chunk)
+                self.report_progress(fh.tell(), file_size)
+        
+        # Combine all chunks
+        return pd.concat(chunks, ignore_index=True)
+    
+    def to_arrow_strings(self, series):
+        """Convert a string or categorical Series to a plain Arrow string array"""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return pa.array(series, from_pandas=True).cast(pa.string())
+        return pa.array(series, type=pa.string(), from_pandas=True)
+    
+    def join_full_path(self, parent, name):
+        """Join parent paths and file names with a backslash, 'nan' standing in for missing parts"""
+        if HAS_PYARROW:
+            try:
+                # Single C pass over the string buffers instead of two object concatenations
+                joined = pc.binary_join_element_wise(
+                    self.to_arrow_strings(parent),
+                    self.to_arrow_strings(name),
+                    '\\', null_handling='replace', null_replacement='nan'
+                )
+                return joined.to_numpy(zero_copy_only=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass  # Non-string values; use the generic path below
+        return parent.astype(str) + '\\' + name.astype(str)
     
     def preprocess_data(self, df):
         """Preprocess and optimize the DataFrame"""
         # Convert timestamp columns
-        timestamp_cols = [col for col in df.columns if any(x in col.lower() 
-                         for x in ['created', 'modified', 'access', 'change'])]
+        timestamp_cols = timestamp_columns(df.columns)
         
         for col in timestamp_cols:
+            # Sniff the layout once so pandas can take its strptime fast path
             try:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-            except:
+                df[col] = parse_timestamps(df[col])
+            except (TypeError, ValueError):
                 pass
         
         # Create full path column if not exists
         if 'FullPath' not in df.columns and 'ParentPath' in df.columns and 'FileName' in df.columns:
-            df['FullPath'] = df['ParentPath'].astype(str) + '\\' + df['FileName'].astype(str)
+            df['FullPath'] = self.join_full_path(df['ParentPath'], df['FileName'])
+        
+        # Derive extensions once here (NaN when a name has none) so filters and analysis just read them;
+        # keep the leading dot so they look like MFTECmd's own Extension column
+        if 'Extension' not in df.columns and 'FileName' in df.columns:
+            parts = df['FileName'].astype(str).str.rpartition('.')
+            df['Extension'] = ('.' + parts[2]).where((parts[1] == '.') & (parts[2] != ''))
+        
+        # Flags with blanks or text values load as object; a missing flag counts as unset
+        for col in BOOL_COLUMNS:
+            if col in df.columns and df[col].dtype != bool:
+                df[col] = df[col].isin([True, 'True', 'true'])
         
         # Optimize data types
-        for col in df.columns:
-            if df[col].dtype == 'object' and col not in timestamp_cols:
-                try:
-                    # Try to convert to category for string columns with repeated values
-                    if df[col].nunique() / len(df) < 0.5:  # Less than 50% unique values
-                        df[col] = df[col].astype('category')
-                except:
-                    pass
+        object_cols = [col for col in df.select_dtypes(include='object').columns
+                       if col not in timestamp_cols]
+        max_unique = min(len(df) // 2, 100_000)
+        converted = 0
+        for col in object_cols:
+            # Known low- and high-cardinality MFT columns skip the uniqueness scan
+            if col in UNIQUE_COLUMNS:
+                continue
+            if col in CATEGORY_COLUMNS or is_low_cardinality(df[col].to_numpy(), max_unique):
+                df[col] = df[col].astype('category')
+                converted += 1
+                # Release replaced object blocks before they pile up on wide files
+                if converted % 8 == 0:
+                    gc.collect()
+        if converted % 8:
+            gc.collect()
+        
+        # Downcast integer columns to the smallest type that fits
+        for col in df.select_dtypes(include='integer').columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
         
         return df
 
+class AnalysisSignals(QObject):
+    """Signals for AnalysisWorker"""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class AnalysisWorker(QRunnable):
+    """Background task that runs an analysis callable off the GUI thread"""
+    
+    def __init__(self, func, *args):
+        super().__init__()
+        self.signals = AnalysisSignals()
+        self.func = func
+        self.args = args
+    
+    def run(self):
+        try:
+            self.signals.finished.emit(self.func(*self.args))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+class AnalysisSnapshot:
+    """The loaded data an analysis run works on, fixed when the run starts"""
+    
+    def __init__(self, df, deleted_mask, deleted_count, ts_cache, analysis_cache):
+        self.df = df
+        self.deleted_mask = deleted_mask
+        self.deleted_count = deleted_count
+        self.ts_cache = ts_cache
+        self.analysis_cache = analysis_cache
+
 class MFTAnalyzer(QMainWindow):
     def __init__(self, csv_file=None):
         super().__init__()
@@ -145,6 +441,21 @@ class MFTAnalyzer(QMainWindow):
         self.filtered_df = pd.DataFrame()
         self.db_path = None
         self.temp_db = None
+        self.conn = None
+        self._db_lock = QMutex()
+        self._db_cancel = None
+        self._search_haystack = None
+        self._filename_arrow = None
+        self._deleted_mask = None
+        self._deleted_count = 0
+        self._flag_masks = {}
+        self._dt_views = {}
+        self._ts_cache = {}
+        self._analysis_cache = {}
+        self._load_generation = 0
+        self._analysis_cancel = None
+        self.report_sections = None
+        self._sized_tables = set()
         
         self.init_ui()
         self.setup_database()
@@ -163,12 +474,12 @@ class MFTAnalyzer(QMainWindow):
         self.progress_bar.setValue(0)
         self.status_bar.showMessage("Loading CSV file...")
         
-        # Start loading in background thread
+        # Start loading on a pooled background thread
         self.loader = DataLoader(file_path)
-        self.loader.progress.connect(self.progress_bar.setValue)
-        self.loader.finished.connect(self.on_data_loaded)
-        self.loader.error.connect(self.on_load_error)
-        self.loader.start()
+        self.loader.signals.progress.connect(self.progress_bar.setValue)
+        self.loader.signals.finished.connect(self.on_data_loaded)
+        self.loader.signals.error.connect(self.on_load_error)
+        QThreadPool.globalInstance().start(self.loader)
         
     def init_ui(self):
         self.setWindowTitle("MFT CSV Analyzer - Professional Edition")
@@ -300,7 +611,10 @@ class MFTAnalyzer(QMainWindow):
         
         # Create table with model
         self.table_model = MFTTableModel()
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
         layout.addWidget(self.table)
         
         # Details panel
@@ -321,9 +635,25 @@ class MFTAnalyzer(QMainWindow):
 
     def clear_filters(self):
         """Clear all active filters"""
-    # Add this method to handle the clear filters toolbar action
-        if hasattr(self, 'status_bar'):
-            self.status_bar.showMessage("Clear filters functionality not implemented yet")
+        self.quick_search.clear()
+        self._search_timer.stop()
+        self.filename_filter.clear()
+        self.extension_filter.setCurrentIndex(0)
+        self.path_filter.clear()
+        self.size_min.setValue(0)
+        self.size_max.setValue(self.size_max.maximum())
+        for checkbox in (self.is_directory_cb, self.has_ads_cb, self.is_ads_cb,
+                         self.deleted_cb, self.copied_cb, self.si_fn_cb):
+            checkbox.setChecked(False)
+        
+        # filtered_df is only ever read, so alias the full dataset rather than copying it
+        self.filtered_df = self.df
+        
+        if not self.df.empty:
+            self.show_filter_results()
+        else:
+            self.update_filter_summary()
+        self.status_bar.showMessage("Filters cleared")
 
     def quick_analysis(self):
         """Run quick analysis and display in status bar"""
@@ -357,7 +687,12 @@ class MFTAnalyzer(QMainWindow):
         
         self.quick_search = QLineEdit()
         self.quick_search.setPlaceholderText("Search filename, path, or content...")
-        self.quick_search.textChanged.connect(self.apply_quick_filter)
+        # Debounce typing so a burst of keystrokes runs a single filter pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.apply_quick_filter)
+        self.quick_search.textChanged.connect(lambda _text: self._search_timer.start())
         quick_layout.addWidget(QLabel("Search:"))
         quick_layout.addWidget(self.quick_search)
         
@@ -492,9 +827,12 @@ class MFTAnalyzer(QMainWindow):
         results_layout.addLayout(results_header)
         
         # Results table
-        self.search_results_table = QTableWidget()
+        self.search_results_model = MFTTableModel()
+        self.search_results_table = QTableView()
+        self.search_results_table.setModel(self.search_results_model)
         self.search_results_table.setAlternatingRowColors(True)
         self.search_results_table.setSortingEnabled(True)
+        self.search_results_table.sortByColumn(0, Qt.AscendingOrder)
         results_layout.addWidget(self.search_results_table)
         
         # Results details
@@ -511,7 +849,7 @@ class MFTAnalyzer(QMainWindow):
         main_splitter.setSizes([400, 1000])
         
         # Connect table selection to show details
-        self.search_results_table.cellClicked.connect(self.show_row_details)
+        self.search_results_table.clicked.connect(self.show_row_details)
     
     def create_timeline_tab(self):
         """Timeline analysis tab"""
@@ -558,7 +896,11 @@ class MFTAnalyzer(QMainWindow):
         layout.addWidget(QFrame())  # Spacer
         
         # Deleted files table
-        self.deleted_files_table = QTableWidget()
+        self.deleted_files_model = MFTTableModel()
+        self.deleted_files_table = QTableView()
+        self.deleted_files_table.setModel(self.deleted_files_model)
+        self.deleted_files_table.setSortingEnabled(True)
+        self.deleted_files_table.sortByColumn(0, Qt.AscendingOrder)
         layout.addWidget(self.deleted_files_table)
         
         # Recovery info
@@ -576,9 +918,9 @@ class MFTAnalyzer(QMainWindow):
         # Analysis controls
         controls_layout = QHBoxLayout()
         
-        run_analysis_btn = QPushButton("Run Full Analysis")
-        run_analysis_btn.clicked.connect(self.run_full_analysis)
-        controls_layout.addWidget(run_analysis_btn)
+        self.run_analysis_btn = QPushButton("Run Full Analysis")
+        self.run_analysis_btn.clicked.connect(self.run_full_analysis)
+        controls_layout.addWidget(self.run_analysis_btn)
         
         self.analysis_type = QComboBox()
         self.analysis_type.addItems([
@@ -614,6 +956,8 @@ class MFTAnalyzer(QMainWindow):
         # Format selection
         self.export_format = QComboBox()
         self.export_format.addItems(["CSV", "JSON", "HTML Report", "Excel"])
+        if HAS_PYARROW:
+            self.export_format.addItem("Parquet")
         export_layout.addWidget(QLabel("Format:"), 0, 0)
         export_layout.addWidget(self.export_format, 0, 1)
         
@@ -628,9 +972,9 @@ class MFTAnalyzer(QMainWindow):
         export_btn.clicked.connect(self.export_data_func)
         export_layout.addWidget(export_btn, 1, 0, 1, 2)
         
-        generate_report_btn = QPushButton("Generate Full Report")
-        generate_report_btn.clicked.connect(self.generate_full_report)
-        export_layout.addWidget(generate_report_btn, 1, 2, 1, 2)
+        self.generate_report_btn = QPushButton("Generate Full Report")
+        self.generate_report_btn.clicked.connect(self.generate_full_report)
+        export_layout.addWidget(self.generate_report_btn, 1, 2, 1, 2)
         
         layout.addWidget(export_group)
         
@@ -649,6 +993,29 @@ class MFTAnalyzer(QMainWindow):
         self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
         self.db_path = self.temp_db.name
         self.temp_db.close()
+        
+        # One connection for the window's lifetime keeps SQLite's page cache warm
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Scratch database: trade durability for bulk-load speed. Large pages
+        # (set before any table exists) and mmap'd reads suit load-once, query-many
+        self.conn.executescript(
+            "PRAGMA page_size=65536; PRAGMA mmap_size=4294967296; "
+            "PRAGMA journal_mode=MEMORY; PRAGMA synchronous=OFF; "
+            "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-131072;"
+        )
+    
+    def closeEvent(self, event):
+        """Release the database connection when the window closes"""
+        if self._analysis_cancel is not None:
+            self._analysis_cancel.set()
+        # Stop a DB build at its next batch rather than waiting for the whole table
+        if self._db_cancel is not None:
+            self._db_cancel.set()
+        if self.conn is not None:
+            with QMutexLocker(self._db_lock):
+                self.conn.close()
+                self.conn = None
+        super().closeEvent(event)
     
     def update_size_units(self):
         """Update size input units"""
@@ -672,13 +1039,37 @@ class MFTAnalyzer(QMainWindow):
     def on_data_loaded(self, df):
         """Handle successful data loading"""
         self.df = df
-        self.filtered_df = df.copy()
+        self.filtered_df = df
+        self._sized_tables.clear()
+        self._deleted_mask = ~df['InUse'].to_numpy(dtype=bool) if 'InUse' in df.columns else None
+        self._deleted_count = int(self._deleted_mask.sum()) if self._deleted_mask is not None else 0
+        self._flag_masks = {col: df[col].to_numpy(dtype=bool) for col in BOOL_COLUMNS if col in df.columns}
+        # int64 nanosecond views of the timestamp columns for range filters (NaT is int64 min);
+        # tz-aware columns keep the pandas comparison since the bounds are naive
+        self._dt_views = {
+            col: df[col].array.asi8
+            for col in df.columns
+            if pd.api.types.is_datetime64_ns_dtype(df[col]) and not isinstance(df[col].dtype, pd.DatetimeTZDtype)
+        }
+        self._ts_cache = {}
+        self._analysis_cache = {}
+        # Results of analyses started on the previous data are dropped when they arrive
+        self._load_generation += 1
+        if self._analysis_cancel is not None:
+            self._analysis_cancel.set()
+        self.build_search_index()
         
         # Update UI
         self.update_table_view()
         self.update_record_counts()
         self.populate_filter_options()
-        self.load_data_to_db()
+        
+        # The SQLite copy isn't needed to show the data, so build it off the GUI thread
+        if self._db_cancel is not None:
+            self._db_cancel.set()  # A build for the previous file is now moot
+        self._db_cancel = threading.Event()
+        self.db_worker = AnalysisWorker(self.load_data_to_db, df, self._db_cancel)
+        QThreadPool.globalInstance().start(self.db_worker)
         
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage(f"Loaded {len(df)} records successfully")
@@ -700,39 +1091,105 @@ class MFTAnalyzer(QMainWindow):
         self.extension_filter.clear()
         self.extension_filter.addItem("")  # Add empty option
         if 'Extension' in self.df.columns:
-            extensions = self.df['Extension'].dropna().unique()
-            self.extension_filter.addItems(sorted(extensions))
-        elif 'FileName' in self.df.columns:
-            # Extract extensions from filename if Extension column doesn't exist
-            extensions = self.df['FileName'].str.extract(r'\.([^.]+)$')[0].dropna().unique()
+            ext_col = self.df['Extension']
+            if isinstance(ext_col.dtype, pd.CategoricalDtype):
+                extensions = ext_col.cat.categories  # distinct values without a scan
+            else:
+                extensions = ext_col.dropna().unique()
             self.extension_filter.addItems(sorted(extensions))
         
         # Populate date column filter
         self.date_column.clear()
-        timestamp_cols = [col for col in self.df.columns if any(x in col.lower() 
-                         for x in ['created', 'modified', 'access', 'change'])]
+        timestamp_cols = timestamp_columns(self.df.columns)
         if timestamp_cols:
             self.date_column.addItems(timestamp_cols)
     
-    def load_data_to_db(self):
-        """Load data to SQLite for fast queries"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            self.df.to_sql('mft_records', conn, if_exists='replace', index=True)
-            
-            # Create indexes for common search fields
-            cursor = conn.cursor()
-            index_columns = ['FileName', 'ParentPath', 'EntryNumber']
-            for col in index_columns:
-                if col in self.df.columns:
-                    try:
-                        cursor.execute(f'CREATE INDEX idx_{col} ON mft_records({col})')
-                    except:
-                        pass  # Index might already exist
-            
-            conn.close()
-        except Exception as e:
-            print(f"Database error: {e}")
+    def load_data_to_db(self, df, cancel):
+        """Load df to SQLite for fast queries; runs on a worker thread"""
+        with QMutexLocker(self._db_lock):
+            if self.conn is None or cancel.is_set():
+                return  # Window closed or another file loaded before the worker started
+            try:
+                if not self.write_db_table('mft_records', df, cancel):
+                    return
+                
+                # Create indexes for common search fields in one transaction
+                index_columns = ['FileName', 'ParentPath', 'EntryNumber']
+                with self.conn:
+                    self.conn.execute('BEGIN')
+                    for col in index_columns:
+                        if col in df.columns:
+                            self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{col} ON mft_records({col})')
+                    self.conn.execute('CREATE INDEX IF NOT EXISTS ix_mft_records_index ON mft_records("index")')
+            except Exception as e:
+                print(f"Database error: {e}")
+    
+    def write_db_table(self, table, df, cancel=None):
+        """Replace table with df's rows, bulk inserted in a single transaction
+        
+        Returns False if cancel is set between batches; rows inserted so far are rolled back.
+        """
+        # Same schema to_sql would create, with the row index as "index"
+        schema = pd.io.sql.get_schema(df.iloc[:0].reset_index(), table, con=self.conn)
+        names = ['index'] + [str(col) for col in df.columns]
+        quoted = ', '.join('"' + name.replace('"', '""') + '"' for name in names)
+        insert = f'INSERT INTO "{table}" ({quoted}) VALUES ({", ".join("?" * len(names))})'
+        
+        with self.conn:
+            self.conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+            self.conn.execute(schema)
+            for start in range(0, len(df), DB_CHUNK_ROWS):
+                if cancel is not None and cancel.is_set():
+                    self.conn.rollback()
+                    return False
+                chunk = df.iloc[start:start + DB_CHUNK_ROWS]
+                columns = [chunk.index.tolist()] + [sql_column_values(chunk[col]) for col in chunk.columns]
+                self.conn.executemany(insert, zip(*columns))
+        return True
+    
+    def _get_ts(self, col, df=None, cache=None):
+        """Return col as datetime64, parsing it at most once per load"""
+        # Workers pass their snapshot's frame and cache so a reload can't mix the two
+        if df is None:
+            df, cache = self.df, self._ts_cache
+        if col not in cache:
+            series = df[col]
+            if not pd.api.types.is_datetime64_any_dtype(series):
+                series = parse_timestamps(series)
+            cache[col] = series
+        return cache[col]
+    
+    def build_search_index(self):
+        """Precompute the lowercased name/path text scanned by quick search"""
+        search_columns = [col for col in ['FileName', 'ParentPath', 'FullPath'] if col in self.df.columns]
+        if not search_columns:
+            self._search_haystack = None
+            self._filename_arrow = None
+            return
+        
+        # One separator-joined string per row, so a search is a single scan
+        haystack = self.df[search_columns[0]].astype(str)
+        for col in search_columns[1:]:
+            haystack = haystack + '\x1f' + self.df[col].astype(str)
+        haystack = haystack.str.lower()
+        
+        if HAS_PYARROW:
+            self._search_haystack = pa.array(haystack.to_numpy(), type=pa.string())
+        else:
+            self._search_haystack = haystack.reset_index(drop=True)
+        
+        if HAS_PYARROW and 'FileName' in self.df.columns:
+            self._filename_arrow = pa.array(self.df['FileName'].astype(str).to_numpy(), type=pa.string())
+        else:
+            self._filename_arrow = None
+    
+    def search_mask(self, search_text):
+        """Boolean mask of rows whose filename or path contains search_text (lowercase)"""
+        if self._search_haystack is None:
+            return np.zeros(len(self.df), dtype=bool)
+        if HAS_PYARROW:
+            return pc.match_substring(self._search_haystack, search_text).to_numpy(zero_copy_only=False)
+        return self._search_haystack.str.contains(search_text, regex=False).to_numpy()
     
     def apply_quick_filter(self):
         """Apply quick search filter"""
@@ -741,21 +1198,11 @@ class MFTAnalyzer(QMainWindow):
         
         search_text = self.quick_search.text().lower()
         if not search_text:
-            self.filtered_df = self.df.copy()
+            self.filtered_df = self.df
         else:
-            # Search in multiple columns
-            mask = pd.Series([False] * len(self.df))
-            search_columns = ['FileName', 'ParentPath', 'FullPath']
-            
-            for col in search_columns:
-                if col in self.df.columns:
-                    mask |= self.df[col].astype(str).str.lower().str.contains(search_text, na=False, regex=False)
-            
-            self.filtered_df = self.df[mask]
+            self.filtered_df = self.df.iloc[self.search_mask(search_text)]
         
-        self.update_search_results()
-        self.update_record_counts()
-        self.update_filter_summary()
+        self.show_filter_results()
     
     def apply_advanced_filters(self):
         """Apply advanced filters with improved logic"""
@@ -763,30 +1210,30 @@ class MFTAnalyzer(QMainWindow):
             return
         
         try:
-            filtered = self.df.copy()
+            df = self.df
+            # Every filter narrows one mask over self.df; rows are gathered once at the end
+            mask = np.ones(len(df), dtype=bool)
             active_filters = []
             
             # Quick search filter
             search_text = self.quick_search.text().strip()
             if search_text:
-                mask = pd.Series([False] * len(filtered))
-                search_columns = ['FileName', 'ParentPath', 'FullPath']
-                
-                for col in search_columns:
-                    if col in filtered.columns:
-                        mask |= filtered[col].astype(str).str.lower().str.contains(search_text.lower(), na=False, regex=False)
-                
-                filtered = filtered[mask]
+                mask &= self.search_mask(search_text.lower())
                 active_filters.append(f"Text search: '{search_text}'")
             
             # Filename pattern filter
             filename_pattern = self.filename_filter.text().strip()
-            if filename_pattern and 'FileName' in filtered.columns:
+            if filename_pattern and 'FileName' in df.columns:
                 try:
-                    # Convert wildcard pattern to regex
-                    import re
-                    pattern = filename_pattern.replace('*', '.*').replace('?', '.')
-                    filtered = filtered[filtered['FileName'].astype(str).str.match(pattern, case=False, na=False)]
+                    if self._filename_arrow is not None:
+                        # Translate the wildcard pattern to SQL LIKE syntax
+                        like = (filename_pattern.replace('\\', '\\\\')
+                                .replace('%', '\\%').replace('_', '\\_')
+                                .replace('*', '%').replace('?', '_'))
+                        mask &= pc.match_like(self._filename_arrow, like, ignore_case=True).to_numpy(zero_copy_only=False)
+                    else:
+                        pattern = fnmatch.translate(filename_pattern)
+                        mask &= df['FileName'].astype(str).str.match(pattern, case=False, na=False).to_numpy()
                     active_filters.append(f"Filename pattern: '{filename_pattern}'")
                 except Exception as e:
                     QMessageBox.warning(self, "Filter Error", f"Invalid filename pattern: {str(e)}")
@@ -794,16 +1241,22 @@ class MFTAnalyzer(QMainWindow):
             # Extension filter
             ext_filter = self.extension_filter.currentText().strip()
             if ext_filter:
-                if 'Extension' in filtered.columns:
-                    filtered = filtered[filtered['Extension'].astype(str).str.lower() == ext_filter.lower()]
-                elif 'FileName' in filtered.columns:
-                    filtered = filtered[filtered['FileName'].astype(str).str.lower().str.endswith(f'.{ext_filter.lower()}', na=False)]
-                active_filters.append(f"Extension: '.{ext_filter}'")
+                # Extensions carry their leading dot; accept the filter typed with or without it
+                ext_filter = '.' + ext_filter.lstrip('.')
+                if 'Extension' in df.columns:
+                    ext = df['Extension']
+                    if isinstance(ext.dtype, pd.CategoricalDtype) and ext.cat.categories.inferred_type == 'string':
+                        # Lowercase each distinct extension once; the trailing False is for code -1 (missing)
+                        matches = np.append(ext.cat.categories.str.lower() == ext_filter.lower(), False)
+                        mask &= matches[ext.cat.codes.to_numpy()]
+                    else:
+                        mask &= (ext.astype(str).str.lower() == ext_filter.lower()).to_numpy(dtype=bool)
+                active_filters.append(f"Extension: '{ext_filter}'")
             
             # Path filter
             path_filter = self.path_filter.text().strip()
-            if path_filter and 'ParentPath' in filtered.columns:
-                filtered = filtered[filtered['ParentPath'].astype(str).str.lower().str.contains(path_filter.lower(), na=False, regex=False)]
+            if path_filter and 'ParentPath' in df.columns:
+                mask &= df['ParentPath'].str.contains(path_filter, na=False, regex=False, case=False).to_numpy()
                 active_filters.append(f"Path contains: '{path_filter}'")
             
             # Size filters
@@ -812,69 +1265,68 @@ class MFTAnalyzer(QMainWindow):
             unit = self.size_unit.currentText()
             multiplier = {'Bytes': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
             
-            if 'FileSize' in filtered.columns:
-                actual_min = size_min * multiplier.get(unit, 1)
-                actual_max = size_max * multiplier.get(unit, 1)
+            if 'FileSize' in df.columns:
+                # Bounds in bytes as int64, so GB-scale limits don't overflow a downcast column
+                actual_min = np.int64(size_min * multiplier.get(unit, 1))
+                actual_max = np.int64(size_max * multiplier.get(unit, 1))
+                sizes = df['FileSize'].to_numpy()
                 
                 if size_min > 0:
-                    filtered = filtered[filtered['FileSize'] >= actual_min]
+                    mask &= sizes >= actual_min
                     active_filters.append(f"Size >= {size_min} {unit}")
                 
                 if size_max < 2147483647:
-                    filtered = filtered[filtered['FileSize'] <= actual_max]
+                    mask &= sizes <= actual_max
                     active_filters.append(f"Size <= {size_max} {unit}")
             
             # Date filters
             date_col = self.date_column.currentText()
-            if date_col and date_col in filtered.columns:
+            if date_col and date_col in df.columns:
                 try:
                     date_from = self.date_from.dateTime().toPyDateTime()
                     date_to = self.date_to.dateTime().toPyDateTime()
                     
-                    # Convert column to datetime if not already
-                    filtered[date_col] = pd.to_datetime(filtered[date_col], errors='coerce')
-                    
-                    # Apply date range filter
-                    date_mask = (filtered[date_col] >= date_from) & (filtered[date_col] <= date_to)
-                    filtered = filtered[date_mask]
+                    if date_col in self._dt_views:
+                        # Compare raw nanoseconds; NaT sorts below any bound and drops out
+                        dates = self._dt_views[date_col]
+                        lo = np.datetime64(date_from, 'ns').astype(np.int64)
+                        hi = np.datetime64(date_to, 'ns').astype(np.int64)
+                        mask &= (dates >= lo) & (dates <= hi)
+                    else:
+                        dates = self._get_ts(date_col)
+                        mask &= ((dates >= date_from) & (dates <= date_to)).to_numpy()
                     
                     active_filters.append(f"Date ({date_col}): {date_from.strftime('%Y-%m-%d')} to {date_to.strftime('%Y-%m-%d')}")
                 except Exception as e:
                     QMessageBox.warning(self, "Date Filter Error", f"Error applying date filter: {str(e)}")
             
-            # Attribute filters
-            if self.is_directory_cb.isChecked() and 'IsDirectory' in filtered.columns:
-                filtered = filtered[filtered['IsDirectory'] == True]
-                active_filters.append("Directories only")
-            
-            if self.has_ads_cb.isChecked() and 'HasAds' in filtered.columns:
-                filtered = filtered[filtered['HasAds'] == True]
-                active_filters.append("Has ADS")
+            # Attribute filters AND the bool arrays cached at load time
+            attribute_filters = [
+                (self.is_directory_cb, self._flag_masks.get('IsDirectory'), "Directories only"),
+                (self.has_ads_cb, self._flag_masks.get('HasAds'), "Has ADS"),
+                (self.is_ads_cb, self._flag_masks.get('IsAds'), "Is ADS"),
+                (self.deleted_cb, self._deleted_mask, "Deleted files (InUse=False)"),
+                (self.copied_cb, self._flag_masks.get('Copied'), "Copied files"),
+                (self.si_fn_cb, self._flag_masks.get('SI<FN'), "SI < FN anomaly"),
+            ]
+            for checkbox, flag, label in attribute_filters:
+                if checkbox.isChecked() and flag is not None:
+                    mask &= flag
+                    active_filters.append(label)
             
-            if self.is_ads_cb.isChecked() and 'IsAds' in filtered.columns:
-                filtered = filtered[filtered['IsAds'] == True]
-                active_filters.append("Is ADS")
-            
-            if self.deleted_cb.isChecked() and 'InUse' in filtered.columns:
-                filtered = filtered[filtered['InUse'] == False]
-                active_filters.append("Deleted files (InUse=False)")
-            
-            if self.copied_cb.isChecked() and 'Copied' in filtered.columns:
-                filtered = filtered[filtered['Copied'] == True]
-                active_filters.append("Copied files")
-            
-            if self.si_fn_cb.isChecked() and 'SI<FN' in filtered.columns:
-                filtered = filtered[filtered['SI<FN'] == True]
-                active_filters.append("SI < FN anomaly")
-            
-            self.filtered_df = filtered
-            self.update_search_results()
-            self.update_record_counts()
-            self.update_filter_summary(active_filters)
+            # Without active filters keep sharing self.df instead of copying it
+            self.filtered_df = df.iloc[mask] if active_filters else df
+            self.show_filter_results(active_filters)
             
         except Exception as e:
             QMessageBox.critical(self, "Filter Error", f"Error applying filters: {str(e)}")
     
+    def show_filter_results(self, active_filters=None):
+        """Show filtered_df in the results table, counts and filter summary"""
+        self.update_search_results()
+        self.update_record_counts()
+        self.update_filter_summary(active_filters)
+    
     def update_filter_summary(self, active_filters=None):
         """Update the filter summary display"""
         if active_filters is None:
@@ -889,7 +1341,7 @@ class MFTAnalyzer(QMainWindow):
     def update_search_results(self):
         """Update search results table with improved column selection"""
         if self.filtered_df.empty:
-            self.search_results_table.setRowCount(0)
+            self.search_results_model.update_data(pd.DataFrame())
             self.results_count_label.setText("Results: 0")
             return
         
@@ -903,54 +1355,28 @@ class MFTAnalyzer(QMainWindow):
         if not available_columns:
             available_columns = list(self.filtered_df.columns[:8])  # First 8 columns
         
-        display_data = self.filtered_df[available_columns]
+        # The model only fetches the cells that are actually visible
+        self.search_results_model.update_data(self.filtered_df, available_columns)
         
-        self.search_results_table.setRowCount(len(display_data))
-        self.search_results_table.setColumnCount(len(available_columns))
-        self.search_results_table.setHorizontalHeaderLabels(available_columns)
-        
-        # Populate search results (limit to 1000 for performance)
-        display_rows = min(1000, len(display_data))
-        for i in range(display_rows):
-            for j, col in enumerate(available_columns):
-                value = display_data.iloc[i, j]
-                if pd.isna(value):
-                    value = ""
-                
-                item = QTableWidgetItem(str(value))
-                
-                # Highlight deleted files
-                if 'InUse' in display_data.columns and not display_data.iloc[i]['InUse']:
-                    item.setBackground(QColor(255, 200, 200))
-                
-                self.search_results_table.setItem(i, j, item)
-        
-        # Auto-resize columns
-        header = self.search_results_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.size_columns_once(self.search_results_table)
         
         # Update results count
-        total_results = len(self.filtered_df)
-        showing = min(display_rows, total_results)
-        self.results_count_label.setText(f"Results: {total_results:,} (showing {showing:,})")
-        
-        if display_rows < len(self.filtered_df):
-            self.status_bar.showMessage(f"Search results: showing first {display_rows:,} of {len(self.filtered_df):,} records")
+        self.results_count_label.setText(f"Results: {len(self.filtered_df):,}")
     
-    def show_row_details(self, row, column):
+    def show_row_details(self, index):
         """Show detailed information for selected row"""
-        if row >= len(self.filtered_df):
+        row = index.row()
+        if row < 0 or row >= self.search_results_model.rowCount():
             return
         
-        selected_row = self.filtered_df.iloc[row]
+        selected_row = self.search_results_model.row_data(row)
         
-        details = "<h4>Record Details</h4><table border='1'>"
-        for col, value in selected_row.items():
-            if pd.notna(value):
-                details += f"<tr><td><b>{col}</b></td><td>{value}</td></tr>"
-        details += "</table>"
+        parts = ["<h4>Record Details</h4><table border='1'>"]
+        for col, value in selected_row.dropna().items():
+            parts.append(f"<tr><td><b>{col}</b></td><td>{value}</td></tr>")
+        parts.append("</table>")
         
-        self.results_details.setHtml(details)
+        self.results_details.setHtml("".join(parts))
     
     def export_filtered_results(self):
         """Export current filtered results"""
@@ -958,19 +1384,24 @@ class MFTAnalyzer(QMainWindow):
             QMessageBox.warning(self, "Warning", "No filtered results to export.")
             return
         
+        file_filter = "CSV Files (*.csv);;Excel Files (*.xlsx);;JSON Files (*.json)"
+        if HAS_PYARROW:
+            file_filter += ";;Parquet Files (*.parquet)"
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Export Filtered Results", f"filtered_mft_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv", 
-            "CSV Files (*.csv);;Excel Files (*.xlsx);;JSON Files (*.json)"
+            file_filter
         )
         
         if file_path:
             try:
                 if file_path.endswith('.csv'):
-                    self.filtered_df.to_csv(file_path, index=False)
+                    self.export_csv(self.filtered_df, file_path)
                 elif file_path.endswith('.xlsx'):
                     self.filtered_df.to_excel(file_path, index=False)
                 elif file_path.endswith('.json'):
-                    self.filtered_df.to_json(file_path, orient='records', date_format='iso')
+                    self.export_json_records(self.filtered_df, file_path)
+                elif file_path.endswith('.parquet'):
+                    self.filtered_df.to_parquet(file_path, index=False, compression='zstd')
                 
                 QMessageBox.information(self, "Success", f"Filtered results exported to:\n{file_path}")
             except Exception as e:
@@ -978,43 +1409,23 @@ class MFTAnalyzer(QMainWindow):
     
     def update_table_view(self):
         """Update the main table view"""
-        if self.filtered_df.empty:
-            return
-        
-        # Update main table
-        self.table.setRowCount(len(self.filtered_df))
-        self.table.setColumnCount(len(self.filtered_df.columns))
-        self.table.setHorizontalHeaderLabels(list(self.filtered_df.columns))
-        
-        # Populate table (show first 1000 rows for performance)
-        display_rows = min(1000, len(self.filtered_df))
-        for i in range(display_rows):
-            for j, col in enumerate(self.filtered_df.columns):
-                value = self.filtered_df.iloc[i, j]
-                if pd.isna(value):
-                    value = ""
-                item = QTableWidgetItem(str(value))
-                
-                # Highlight deleted files based on InUse flag
-                if 'InUse' in self.filtered_df.columns and not self.filtered_df.iloc[i]['InUse']:
-                    item.setBackground(QColor(255, 200, 200))
-                
-                self.table.setItem(i, j, item)
-        
-        # Auto-resize columns
-        self.table.resizeColumnsToContents()
+        self.table_model.update_data(self.filtered_df)
         
-        if display_rows < len(self.filtered_df):
-            self.status_bar.showMessage(f"Showing first {display_rows} of {len(self.filtered_df)} records")
+        self.size_columns_once(self.table)
+    
+    def size_columns_once(self, table):
+        """Fit column widths to contents the first time a table shows data after a load"""
+        if table not in self._sized_tables and table.model().rowCount() > 0:
+            table.resizeColumnsToContents()
+            self._sized_tables.add(table)
     
     def update_record_counts(self):
         """Update record count labels"""
         self.records_label.setText(f"Records: {len(self.df):,}")
         self.filtered_label.setText(f"Filtered: {len(self.filtered_df):,}")
         
-        if 'InUse' in self.df.columns:
-            deleted_count = (~self.df['InUse']).sum()
-            self.deleted_count_label.setText(f"Deleted Files: {deleted_count:,}")
+        if self._deleted_mask is not None:
+            self.deleted_count_label.setText(f"Deleted Files: {self._deleted_count:,}")
     
     def scan_deleted_files(self):
         """Scan and display deleted files"""
@@ -1022,11 +1433,11 @@ class MFTAnalyzer(QMainWindow):
             QMessageBox.warning(self, "Warning", "No data loaded.")
             return
         
-        if 'InUse' not in self.df.columns:
+        if self._deleted_mask is None:
             QMessageBox.information(self, "Info", "No InUse column found in data.")
             return
         
-        deleted_files = self.df[self.df['InUse'] == False]
+        deleted_files = self.df[self._deleted_mask]
         
         if deleted_files.empty:
             QMessageBox.information(self, "Info", "No deleted files found.")
@@ -1036,21 +1447,8 @@ class MFTAnalyzer(QMainWindow):
         key_columns = ['EntryNumber', 'FileName', 'ParentPath', 'FileSize', 'Created0x10', 'LastModified0x10']
         available_columns = [col for col in key_columns if col in deleted_files.columns]
         
-        self.deleted_files_table.setRowCount(len(deleted_files))
-        self.deleted_files_table.setColumnCount(len(available_columns))
-        self.deleted_files_table.setHorizontalHeaderLabels(available_columns)
-        
-        # Populate deleted files table
-        for i in range(len(deleted_files)):
-            for j, col in enumerate(available_columns):
-                value = deleted_files.iloc[i][col]
-                if pd.isna(value):
-                    value = ""
-                item = QTableWidgetItem(str(value))
-                item.setBackground(QColor(255, 200, 200))  # Highlight deleted files
-                self.deleted_files_table.setItem(i, j, item)
-        
-        self.deleted_files_table.resizeColumnsToContents()
+        self.deleted_files_model.update_data(deleted_files, available_columns)
+        self.size_columns_once(self.deleted_files_table)
         self.deleted_count_label.setText(f"Deleted Files: {len(deleted_files):,}")
     
     def generate_timeline(self):
@@ -1063,8 +1461,7 @@ class MFTAnalyzer(QMainWindow):
         
         try:
             # Find timestamp columns
-            timestamp_cols = [col for col in self.df.columns if any(x in col.lower() 
-                             for x in ['created', 'modified', 'access', 'change'])]
+            timestamp_cols = timestamp_columns(self.df.columns)
             
             if not timestamp_cols:
                 QMessageBox.warning(self, "Warning", "No timestamp columns found.")
@@ -1073,8 +1470,9 @@ class MFTAnalyzer(QMainWindow):
             timeline_html = self.create_timeline_visualization(timeline_type, timestamp_cols)
             
             # Save and open timeline
-            timeline_file = tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False)
-            timeline_file.write(timeline_html)
+            # One pre-encoded write; text mode would also fall back to the locale codec
+            timeline_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.html', delete=False)
+            timeline_file.write(timeline_html.encode('utf-8'))
             timeline_file.close()
             
             webbrowser.open(f'file://{timeline_file.name}')
@@ -1097,15 +1495,16 @@ class MFTAnalyzer(QMainWindow):
         # Process timestamp data
         for col in timestamp_cols[:3]:  # Limit to first 3 timestamp columns
             try:
-                timestamps = pd.to_datetime(self.df[col], errors='coerce').dropna()
+                timestamps = self._get_ts(col).dropna()
                 if not timestamps.empty:
                     # Create histogram of activity over time
-                    hist_data = timestamps.dt.date.value_counts().sort_index()
+                    hist_data = timestamps.dt.floor('D').value_counts().sort_index()
+                    x, y = minmax_downsample(hist_data.index, hist_data.values)
                     
                     fig.add_trace(
-                        go.Scatter(
-                            x=hist_data.index,
-                            y=hist_data.values,
+                        go.Scattergl(
+                            x=x,
+                            y=y,
                             mode='lines+markers',
                             name=col,
                             line=dict(width=2)
@@ -1118,14 +1517,15 @@ class MFTAnalyzer(QMainWindow):
         # Activity distribution (hourly)
         if timestamp_cols:
             try:
-                main_timestamp = pd.to_datetime(self.df[timestamp_cols[0]], errors='coerce').dropna()
+                main_timestamp = self._get_ts(timestamp_cols[0]).dropna()
                 if not main_timestamp.empty:
-                    hourly_activity = main_timestamp.dt.hour.value_counts().sort_index()
+                    # Plain arrays keep Plotly from inspecting pandas objects
+                    hourly_activity = np.bincount(main_timestamp.dt.hour.to_numpy(), minlength=24)
                     
                     fig.add_trace(
                         go.Bar(
-                            x=hourly_activity.index,
-                            y=hourly_activity.values,
+                            x=np.arange(24),
+                            y=hourly_activity,
                             name='Hourly Activity',
                             marker_color='lightblue'
                         ),
@@ -1150,29 +1550,32 @@ class MFTAnalyzer(QMainWindow):
     
     def generate_timeline_summary(self, timestamp_cols):
         """Generate timeline summary text"""
-        summary = "<h3>Timeline Analysis Summary</h3>"
+        parts = ["<h3>Timeline Analysis Summary</h3>"]
         
         for col in timestamp_cols:
             try:
-                timestamps = pd.to_datetime(self.df[col], errors='coerce').dropna()
-                if not timestamps.empty:
-                    earliest = timestamps.min()
-                    latest = timestamps.max()
+                # Reduce raw (UTC) nanoseconds; NaT is the int64 minimum
+                timestamps = self._get_ts(col)
+                ns = timestamps.array.asi8
+                ns = ns[ns != np.iinfo(np.int64).min]
+                if ns.size:
+                    earliest = pd.Timestamp(ns.min(), tz=timestamps.dt.tz)
+                    latest = pd.Timestamp(ns.max(), tz=timestamps.dt.tz)
                     total_days = (latest - earliest).days
                     
-                    summary += f"""
+                    parts.append(f"""
                     <h4>{col}</h4>
                     <ul>
                         <li>Earliest: {earliest.strftime('%Y-%m-%d %H:%M:%S')}</li>
                         <li>Latest: {latest.strftime('%Y-%m-%d %H:%M:%S')}</li>
                         <li>Time Span: {total_days} days</li>
-                        <li>Total Records: {len(timestamps):,}</li>
+                        <li>Total Records: {ns.size:,}</li>
                     </ul>
-                    """
+                    """)
             except Exception as e:
-                summary += f"<p>Error processing {col}: {str(e)}</p>"
+                parts.append(f"<p>Error processing {col}: {str(e)}</p>")
         
-        return summary
+        return "".join(parts)
     
     def run_full_analysis(self):
         """Run comprehensive analysis"""
@@ -1181,157 +1584,197 @@ class MFTAnalyzer(QMainWindow):
             return
         
         analysis_type = self.analysis_type.currentText()
+        self.start_analysis(self.get_analysis, analysis_type, on_finished=self.analysis_results.setHtml)
+    
+    def start_analysis(self, func, *args, on_finished):
+        """Run func(snapshot, *args, cancel) on the thread pool, one analysis at a time"""
+        self.run_analysis_btn.setEnabled(False)
+        self.generate_report_btn.setEnabled(False)
+        self.status_bar.showMessage("Running analysis...")
+        
+        # The worker only sees this snapshot, so a reload mid-run can't change its inputs
+        snapshot = AnalysisSnapshot(
+            self.df, self._deleted_mask, self._deleted_count, self._ts_cache, self._analysis_cache
+        )
+        generation = self._load_generation
+        self._analysis_cancel = threading.Event()
         
-        try:
-            if analysis_type == "File Type Distribution":
-                result = self.analyze_file_types()
-            elif analysis_type == "Size Analysis":
-                result = self.analyze_file_sizes()
-            elif analysis_type == "Timestamp Analysis":
-                result = self.analyze_timestamps()
-            elif analysis_type == "Attribute Analysis":
-                result = self.analyze_attributes()
-            elif analysis_type == "Directory Structure":
-                result = self.analyze_directory_structure()
-            else:
-                result = "Analysis type not implemented yet."
-            
-            self.analysis_results.setHtml(result)
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Analysis error: {str(e)}")
+        self.analysis_worker = AnalysisWorker(func, snapshot, *args, self._analysis_cancel)
+        self.analysis_worker.signals.finished.connect(
+            lambda result: self.on_analysis_done(result, generation, on_finished)
+        )
+        self.analysis_worker.signals.error.connect(
+            lambda error_msg: self.on_analysis_error(error_msg, generation)
+        )
+        QThreadPool.globalInstance().start(self.analysis_worker)
+    
+    def on_analysis_done(self, result, generation, on_finished):
+        """Deliver a worker's result unless the data was reloaded while it ran"""
+        self.run_analysis_btn.setEnabled(True)
+        self.generate_report_btn.setEnabled(True)
+        self._analysis_cancel = None
+        if generation != self._load_generation:
+            self.status_bar.showMessage("Analysis discarded: data was reloaded")
+            return
+        on_finished(result)
+        self.status_bar.showMessage("Analysis complete")
     
-    def analyze_file_types(self):
+    def on_analysis_error(self, error_msg, generation):
+        """Handle analysis errors"""
+        self.run_analysis_btn.setEnabled(True)
+        self.generate_report_btn.setEnabled(True)
+        self._analysis_cancel = None
+        if generation != self._load_generation:
+            self.status_bar.showMessage("Analysis discarded: data was reloaded")
+            return
+        self.status_bar.showMessage("Analysis failed")
+        QMessageBox.critical(self, "Error", f"Analysis error: {error_msg}")
+    
+    def get_analysis(self, data, analysis_type, cancel=None):
+        """Return the HTML for analysis_type, computing it at most once per load"""
+        # A single analysis is one analyze_* call, so there is no point to check cancel
+        analyses = {
+            "File Type Distribution": self.analyze_file_types,
+            "Size Analysis": self.analyze_file_sizes,
+            "Timestamp Analysis": self.analyze_timestamps,
+            "Attribute Analysis": self.analyze_attributes,
+            "Directory Structure": self.analyze_directory_structure,
+        }
+        if analysis_type not in analyses:
+            return "Analysis type not implemented yet."
+        
+        # Analyses always cover the full dataset, so results hold until the next load
+        cache = data.analysis_cache
+        if analysis_type not in cache:
+            cache[analysis_type] = analyses[analysis_type](data)
+        return cache[analysis_type]
+    
+    def analyze_file_types(self, data):
         """Analyze file type distribution"""
-        result = "<h3>File Type Distribution (Top 20)</h3>"
+        parts = ["<h3>File Type Distribution (Top 20)</h3>"]
         
-        if 'Extension' in self.df.columns:
-            extensions = self.df['Extension'].fillna('No Extension')
-        elif 'FileName' in self.df.columns:
-            extensions = self.df['FileName'].str.extract(r'\.([^.]+)')[0].fillna('No Extension')
-        else:
+        if 'Extension' not in data.df.columns:
             return "<p>No filename or extension data found.</p>"
         
-        ext_counts = extensions.value_counts().head(20)
+        ext_counts = data.df['Extension'].value_counts(dropna=False, sort=False).nlargest(20)
         
-        result += "<table border='1'>"
-        result += "<tr><th>Extension</th><th>Count</th><th>Percentage</th></tr>"
+        parts.append("<table border='1'>")
+        parts.append("<tr><th>Extension</th><th>Count</th><th>Percentage</th></tr>")
         
-        total_files = len(self.df)
+        total_files = len(data.df)
         for ext, count in ext_counts.items():
             percentage = (count / total_files) * 100
-            ext_display = ext if ext != 'No Extension' else 'No Extension'
-            if ext != 'No Extension':
-                ext_display = f".{ext}"
-            result += f"<tr><td>{ext_display}</td><td>{count:,}</td><td>{percentage:.2f}%</td></tr>"
+            if pd.isna(ext):
+                ext_display = 'No Extension'
+            else:
+                ext_display = ext if str(ext).startswith('.') else f".{ext}"
+            parts.append(f"<tr><td>{ext_display}</td><td>{count:,}</td><td>{percentage:.2f}%</td></tr>")
         
-        result += "</table>"
-        return result
+        parts.append("</table>")
+        return "".join(parts)
     
-    def analyze_file_sizes(self):
+    def analyze_file_sizes(self, data):
         """Analyze file size distribution"""
-        if 'FileSize' not in self.df.columns:
+        if 'FileSize' not in data.df.columns:
             return "<p>FileSize column not found.</p>"
         
-        sizes = self.df['FileSize'].dropna()
+        sizes = data.df['FileSize'].dropna().to_numpy()
+        if sizes.size == 0:
+            return "<h3>File Size Analysis</h3><p>No file size data found.</p>"
+        
+        # Reduce the raw array once per metric; accumulate in int64 since sizes may be downcast
+        total = sizes.sum(dtype=np.int64) if sizes.dtype.kind in 'iu' else sizes.sum()
         
-        result = "<h3>File Size Analysis</h3>"
-        result += f"""
+        parts = ["<h3>File Size Analysis</h3>"]
+        parts.append(f"""
         <table border='1'>
             <tr><th>Metric</th><th>Value</th></tr>
             <tr><td>Total Files</td><td>{len(sizes):,}</td></tr>
-            <tr><td>Total Size</td><td>{sizes.sum():,} bytes ({sizes.sum() / (1024**3):.2f} GB)</td></tr>
-            <tr><td>Average Size</td><td>{sizes.mean():.0f} bytes</td></tr>
-            <tr><td>Median Size</td><td>{sizes.median():.0f} bytes</td></tr>
+            <tr><td>Total Size</td><td>{total:,} bytes ({total / (1024**3):.2f} GB)</td></tr>
+            <tr><td>Average Size</td><td>{total / len(sizes):.0f} bytes</td></tr>
+            <tr><td>Median Size</td><td>{np.median(sizes):.0f} bytes</td></tr>
             <tr><td>Largest File</td><td>{sizes.max():,} bytes</td></tr>
             <tr><td>Smallest File</td><td>{sizes.min():,} bytes</td></tr>
         </table>
-        """
+        """)
         
-        return result
+        return "".join(parts)
     
-    def analyze_timestamps(self):
+    def analyze_timestamps(self, data):
         """Analyze timestamp patterns"""
-        timestamp_cols = [col for col in self.df.columns if any(x in col.lower() 
-                         for x in ['created', 'modified', 'access', 'change'])]
+        timestamp_cols = timestamp_columns(data.df.columns)
         
         if not timestamp_cols:
             return "<p>No timestamp columns found.</p>"
         
-        result = "<h3>Timestamp Analysis</h3>"
+        parts = ["<h3>Timestamp Analysis</h3>"]
         
         for col in timestamp_cols:
             try:
-                timestamps = pd.to_datetime(self.df[col], errors='coerce').dropna()
+                timestamps = self._get_ts(col, data.df, data.ts_cache).dropna()
                 if not timestamps.empty:
-                    result += f"""
+                    parts.append(f"""
                     <h4>{col}</h4>
                     <ul>
                         <li>Valid Timestamps: {len(timestamps):,}</li>
                         <li>Date Range: {timestamps.min().strftime('%Y-%m-%d')} to {timestamps.max().strftime('%Y-%m-%d')}</li>
-                        <li>Most Active Day: {timestamps.dt.date.value_counts().index[0]}</li>
+                        <li>Most Active Day: {timestamps.dt.floor('D').value_counts().index[0].date()}</li>
                         <li>Most Active Hour: {timestamps.dt.hour.value_counts().index[0]}:00</li>
                     </ul>
-                    """
+                    """)
             except Exception as e:
-                result += f"<p>Error analyzing {col}: {str(e)}</p>"
+                parts.append(f"<p>Error analyzing {col}: {str(e)}</p>")
         
-        return result
+        return "".join(parts)
     
-    def analyze_attributes(self):
+    def analyze_attributes(self, data):
         """Analyze file attributes"""
-        result = "<h3>File Attributes Analysis</h3>"
-        result += "<table border='1'><tr><th>Attribute</th><th>Count</th><th>Percentage</th></tr>"
+        parts = ["<h3>File Attributes Analysis</h3>"]
+        parts.append("<table border='1'><tr><th>Attribute</th><th>Count</th><th>Percentage</th></tr>")
         
-        total_files = len(self.df)
+        total_files = len(data.df)
         
-        # Check various boolean attributes
-        bool_attrs = ['InUse', 'IsDirectory', 'HasAds', 'IsAds', 'Copied', 'SI<FN', 'uSecZeros']
+        # Flag columns are plain bool after loading, so each count is one sum
+        for attr in BOOL_COLUMNS:
+            if attr in data.df.columns:
+                count = int(data.df[attr].sum())
+                percentage = (count / total_files) * 100
+                parts.append(f"<tr><td>{attr}</td><td>{count:,}</td><td>{percentage:.2f}%</td></tr>")
         
-        for attr in bool_attrs:
-            if attr in self.df.columns:
-                try:
-                    if self.df[attr].dtype == 'bool':
-                        count = self.df[attr].sum()
-                        percentage = (count / total_files) * 100
-                        result += f"<tr><td>{attr}</td><td>{count:,}</td><td>{percentage:.2f}%</td></tr>"
-                except:
-                    result += f"<tr><td>{attr}</td><td>Error</td><td>-</td></tr>"
-        
-        result += "</table>"
+        parts.append("</table>")
         
         # Deleted files analysis
-        if 'InUse' in self.df.columns:
-            deleted_count = (~self.df['InUse']).sum()
+        if data.deleted_mask is not None:
+            deleted_count = data.deleted_count
             deleted_percentage = (deleted_count / total_files) * 100
-            result += f"""
+            parts.append(f"""
             <h4>Deletion Analysis</h4>
             <ul>
                 <li>Deleted Files (InUse=False): {deleted_count:,} ({deleted_percentage:.2f}%)</li>
                 <li>Active Files (InUse=True): {total_files - deleted_count:,} ({100 - deleted_percentage:.2f}%)</li>
             </ul>
-            """
+            """)
         
-        return result
+        return "".join(parts)
     
-    def analyze_directory_structure(self):
+    def analyze_directory_structure(self, data):
         """Analyze directory structure"""
-        if 'ParentPath' not in self.df.columns:
+        if 'ParentPath' not in data.df.columns:
             return "<p>ParentPath column not found.</p>"
         
-        # Count files per directory
-        dir_counts = self.df['ParentPath'].value_counts().head(20)
+        # Count files per directory; partial-select the top 20 rather than sorting every directory
+        dir_counts = data.df['ParentPath'].value_counts(sort=False).nlargest(20)
         
-        result = "<h3>Directory Structure Analysis</h3>"
-        result += "<h4>Top 20 Directories by File Count</h4>"
-        result += "<table border='1'><tr><th>Directory</th><th>File Count</th></tr>"
+        parts = ["<h3>Directory Structure Analysis</h3>"]
+        parts.append("<h4>Top 20 Directories by File Count</h4>")
+        parts.append("<table border='1'><tr><th>Directory</th><th>File Count</th></tr>")
         
         for directory, count in dir_counts.items():
-            result += f"<tr><td>{directory}</td><td>{count:,}</td></tr>"
+            parts.append(f"<tr><td>{directory}</td><td>{count:,}</td></tr>")
         
-        result += "</table>"
+        parts.append("</table>")
         
-        return result
+        return "".join(parts)
     
     def export_chart(self):
         """Export current analysis chart"""
@@ -1351,8 +1794,8 @@ class MFTAnalyzer(QMainWindow):
             export_df = self.df
         elif data_type == "Filtered Data":
             export_df = self.filtered_df
-        elif data_type == "Deleted Files Only" and 'InUse' in self.df.columns:
-            export_df = self.df[self.df['InUse'] == False]
+        elif data_type == "Deleted Files Only" and self._deleted_mask is not None:
+            export_df = self.df[self._deleted_mask]
         else:
             export_df = self.df
         
@@ -1360,30 +1803,94 @@ class MFTAnalyzer(QMainWindow):
         if export_format == "CSV":
             file_path, _ = QFileDialog.getSaveFileName(self, "Export CSV", "", "CSV Files (*.csv)")
             if file_path:
-                export_df.to_csv(file_path, index=False)
+                self.export_csv(export_df, file_path)
         
         elif export_format == "JSON":
             file_path, _ = QFileDialog.getSaveFileName(self, "Export JSON", "", "JSON Files (*.json)")
             if file_path:
-                export_df.to_json(file_path, orient='records', date_format='iso')
+                self.export_json_records(export_df, file_path)
         
         elif export_format == "Excel":
             file_path, _ = QFileDialog.getSaveFileName(self, "Export Excel", "", "Excel Files (*.xlsx)")
             if file_path:
                 export_df.to_excel(file_path, index=False)
         
+        elif export_format == "Parquet":
+            file_path, _ = QFileDialog.getSaveFileName(self, "Export Parquet", "", "Parquet Files (*.parquet)")
+            if file_path:
+                # Columnar and compressed; categoricals and timestamps keep their types
+                export_df.to_parquet(file_path, index=False, compression='zstd')
+        
         elif export_format == "HTML Report":
             file_path, _ = QFileDialog.getSaveFileName(self, "Export HTML", "", "HTML Files (*.html)")
             if file_path:
                 html_content = self.generate_html_report(export_df)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                with open(file_path, 'wb') as f:
+                    f.write(html_content.encode('utf-8'))
         
         if 'file_path' in locals() and file_path:
             QMessageBox.information(self, "Success", f"Data exported successfully to:\n{file_path}")
     
+    def export_csv(self, df, file_path):
+        """Write df as CSV a chunk of rows at a time, with Arrow's C++ writer when available"""
+        if HAS_PYARROW:
+            try:
+                # Arrow writes flags as true/false; keep to_csv's True/False
+                bool_cols = [col for col in df.columns if pd.api.types.is_bool_dtype(df[col])]
+                flag_text = {True: 'True', False: 'False'}
+                # One schema for every chunk, so dictionary and all-null chunks line up
+                schema = pa.Schema.from_pandas(df, preserve_index=False)
+                for col in bool_cols:
+                    schema = schema.set(schema.get_field_index(col), pa.field(col, pa.string()))
+                # Arrow quotes every string under 'needed' (and always quotes the header), so write
+                # unquoted and leave fields that need quotes to pandas via ArrowInvalid
+                write_options = pa_csv.WriteOptions(include_header=False, quoting_style='none')
+                header = io.StringIO()
+                csv.writer(header, lineterminator='\n').writerow(df.columns)
+                with open(file_path, 'wb') as fh:
+                    fh.write(header.getvalue().encode('utf-8'))
+                    with pa_csv.CSVWriter(fh, schema, write_options=write_options) as writer:
+                        for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+                            chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS]
+                            if bool_cols:
+                                chunk = chunk.assign(**{col: chunk[col].map(flag_text) for col in bool_cols})
+                            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                return
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass  # Mixed-type columns or values that need quoting; pandas rewrites the file below
+        df.to_csv(file_path, index=False, chunksize=EXPORT_CHUNK_ROWS)
+    
+    def export_json_records(self, df, file_path):
+        """Write df as a JSON array of records, serializing a chunk of rows at a time"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write('[')
+            for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+                chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS].to_json(orient='records', date_format='iso')
+                if start:
+                    f.write(',')
+                f.write(chunk[1:-1])  # Drop the chunk's own brackets
+            f.write(']')
+    
+    def sample_table_html(self, df, rows=100):
+        """Render the first rows of df as a plain HTML table"""
+        sample = df.iloc[:rows]
+        header = "".join(f"<th>{col}</th>" for col in sample.columns)
+        body = "\n".join(
+            "<tr>" + "".join(f"<td>{'' if pd.isna(value) else value}</td>" for value in row) + "</tr>"
+            for row in sample.itertuples(index=False, name=None)
+        )
+        return (f"<table class='data-table' id='data_table'><thead><tr>{header}</tr></thead>"
+                f"<tbody>\n{body}\n</tbody></table>")
+    
     def generate_html_report(self, df):
         """Generate comprehensive HTML report"""
+        # Resolve dynamic values once, outside the template
+        generated = time.strftime('%Y-%m-%d %H:%M:%S')
+        if df is self.df and self._deleted_mask is not None:
+            deleted = self._deleted_count  # Counted once at load
+        else:
+            deleted = (~df['InUse']).sum() if 'InUse' in df.columns else 'N/A'
+        
         html = f"""
         <!DOCTYPE html>
         <html>
@@ -1402,13 +1909,13 @@ class MFTAnalyzer(QMainWindow):
             <h1>MFT Analysis Report</h1>
             <div class="summary">
                 <h2>Summary</h2>
-                <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                <p>Generated: {generated}</p>
                 <p>Total Records: {len(df):,}</p>
-                <p>Deleted Files: {(~df['InUse']).sum() if 'InUse' in df.columns else 'N/A'}</p>
+                <p>Deleted Files: {deleted}</p>
             </div>
             
             <h2>Data Sample (First 100 Records)</h2>
-            {df.head(100).to_html(classes='data-table', table_id='data_table', escape=False)}
+            {self.sample_table_html(df)}
         </body>
         </html>
         """
@@ -1420,9 +1927,25 @@ class MFTAnalyzer(QMainWindow):
             QMessageBox.warning(self, "Warning", "No data loaded.")
             return
         
-        # Generate all analyses
-        file_types = self.analyze_file_types()
-        sizes = self.analyze_file_sizes()
-        timestamps = self.analyze_timestamps()
-        attributes = self.analyze_attributes()
-        directory = self.analyze_directory_structure()
\ No newline at end of file
+        # Generate all analyses off the GUI thread
+        self.start_analysis(self.collect_report_sections, on_finished=self.on_report_sections_ready)
+    
+    def collect_report_sections(self, data, cancel):
+        """Compute every analysis that makes up the full report"""
+        sections = {}
+        for key, analysis_type in [
+            ('file_types', "File Type Distribution"),
+            ('sizes', "Size Analysis"),
+            ('timestamps', "Timestamp Analysis"),
+            ('attributes', "Attribute Analysis"),
+            ('directory', "Directory Structure"),
+        ]:
+            # A reload or window close makes the rest of the report moot
+            if cancel.is_set():
+                return None
+            sections[key] = self.get_analysis(data, analysis_type)
+        return sections
+    
+    def on_report_sections_ready(self, sections):
+        """Keep the computed report sections once the worker delivers them"""
+        self.report_sections = sections
\ No newline at end of file
@@ -1,6 +1,5 @@
 # app/gui_explore.py
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox
-from app.gui_dash import MFTAnalyzer as DashboardPage
 
 class ExplorePage(QWidget):
     def __init__(self, parent=None):
@@ -33,8 +32,11 @@ class ExplorePage(QWidget):
         )
 
         if csv_file:
+            # Imported on first use: the dashboard pulls in pandas, pyarrow and plotly
+            from app.gui_dash import MFTAnalyzer as DashboardPage
             try:
-                dashboard = DashboardPage(csv_file)
-                dashboard.show()
+                # Keep a reference so the window outlives this slot while it loads in the background
+                self.dashboard = DashboardPage(csv_file)
+                self.dashboard.show()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load Dashboard:\n{e}")
@@ -5,7 +5,7 @@ import string
 import subprocess
 import sys
 import ctypes
-import pandas as pd
+import functools
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QComboBox, QPushButton,
     QFileDialog, QMessageBox, QDialog, QTextEdit,
@@ -13,9 +13,6 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 
-from app.gui_dash import MFTAnalyzer as DashboardPage
-from app.gui_home import HomePage  
-
 
 def resource_path(relative_path):
     """Get absolute path to resource (works for dev, onedir, onefile)"""
@@ -24,12 +21,13 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)  # dev/onedir mode
 
 
+@functools.lru_cache(maxsize=None)
 def is_admin():
-    """Check if the program is running with admin rights"""
+    """Check if the program is running with admin rights (fixed for the process lifetime)"""
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
-        return False
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except (AttributeError, OSError):
+        return False  # Not on Windows, or shell32 unavailable
 
 
 rawcopy_path = resource_path("tools/RawCopy.exe")
@@ -107,6 +105,25 @@ class MFTGeneratorThread(QThread):
         self.drive = drive
         self.save_path = save_path
     
+    def run_tool(self, args, name):
+        """Run an external tool, streaming its output to the terminal line by line"""
+        with subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1
+        ) as process:
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    self.terminal_update.emit(f"{name}: {line}")
+            returncode = process.wait()
+        
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, name)
+    
     def run(self):
         try:
             save_folder = os.path.dirname(self.save_path)
@@ -122,38 +139,36 @@ class MFTGeneratorThread(QThread):
                 self.finished_error.emit("Administrator rights are required to run RawCopy.")
                 return
 
-            # Run RawCopy with full path & admin
-            ps_command = (
-                f'Start-Process "{rawcopy_path}" '
-                f'-ArgumentList \'/FileNamePath:{self.drive}\\$MFT\',\'/OutputPath:{save_folder}\',\'/OutputName:{save_name}\' '
-                f'-Verb RunAs -Wait'
-            )
+            # Run RawCopy directly; it inherits this process's admin token
+            rawcopy_args = [
+                rawcopy_path,
+                f"/FileNamePath:{self.drive}\\$MFT",
+                f"/OutputPath:{save_folder}",
+                f"/OutputName:{save_name}"
+            ]
             
             self.terminal_update.emit("Executing RawCopy command...")
-            self.terminal_update.emit(f"Command: {ps_command}")
+            self.terminal_update.emit(f"Command: {subprocess.list2cmdline(rawcopy_args)}")
             
-            process = subprocess.run(
-                ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", ps_command],
-                capture_output=True,
-                text=True
-            )
-            
-            if process.returncode != 0:
-                self.terminal_update.emit(f"RawCopy stderr: {process.stderr}")
-                raise subprocess.CalledProcessError(process.returncode, "RawCopy")
+            self.run_tool(rawcopy_args, "RawCopy")
             
             self.terminal_update.emit("RawCopy completed successfully")
             self.status_update.emit("Waiting for MFT.bin file creation...", 30)
             
-            # Wait until file exists
+            # Wait until file exists, checking often but reporting once a second
             timeout = 60
-            waited = 0
-            while (not os.path.exists(self.save_path) or os.path.getsize(self.save_path) == 0) and waited < timeout:
-                self.terminal_update.emit(f"Waiting for file... ({waited}/{timeout}s)")
-                time.sleep(2)
-                waited += 2
-                progress = 30 + (waited / timeout * 20)  # 30-50%
-                self.status_update.emit(f"Waiting for MFT.bin file creation... ({waited}s)", int(progress))
+            start = time.monotonic()
+            reported = -1
+            while (not os.path.exists(self.save_path) or os.path.getsize(self.save_path) == 0):
+                waited = int(time.monotonic() - start)
+                if waited >= timeout:
+                    break
+                if waited != reported:
+                    reported = waited
+                    self.terminal_update.emit(f"Waiting for file... ({waited}/{timeout}s)")
+                    progress = 30 + (waited / timeout * 20)  # 30-50%
+                    self.status_update.emit(f"Waiting for MFT.bin file creation... ({waited}s)", int(progress))
+                time.sleep(0.1)
             
             if not os.path.exists(self.save_path) or os.path.getsize(self.save_path) == 0:
                 self.terminal_update.emit("ERROR: MFT.bin file was not created or is empty")
@@ -170,15 +185,11 @@ class MFTGeneratorThread(QThread):
             self.terminal_update.emit("Starting MFTECmd conversion...")
             self.terminal_update.emit(f"Output CSV folder: {save_csv_folder}")
             
-            process = subprocess.run([
+            self.run_tool([
                 mftecmd_path,
                 "-f", self.save_path,
                 "--csv", save_csv_folder
-            ], capture_output=True, text=True)
-            
-            if process.returncode != 0:
-                self.terminal_update.emit(f"MFTECmd stderr: {process.stderr}")
-                raise subprocess.CalledProcessError(process.returncode, "MFTECmd")
+            ], "MFTECmd")
             
             self.terminal_update.emit("MFTECmd completed successfully")
             self.status_update.emit("Locating generated CSV file...", 80)
@@ -249,6 +260,14 @@ class GeneratePage(QWidget):
 
     def list_drives(self):
         """List available drives on Windows"""
+        try:
+            # One bitmask call, so stale network mappings can't stall the UI
+            mask = ctypes.windll.kernel32.GetLogicalDrives()
+        except (AttributeError, OSError):
+            mask = None
+        if mask:
+            return [f"{letter}:" for i, letter in enumerate(string.ascii_uppercase) if mask & (1 << i)]
+        
         drives = []
         for letter in string.ascii_uppercase:
             if os.path.exists(f"{letter}:\\"):
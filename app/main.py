@@ -9,7 +9,6 @@ from PyQt5.QtWidgets import (
 )
 
 from app.gui_generate import GeneratePage
-from app.gui_dash import MFTAnalyzer as DashboardPage
 
 
 class MainWindow(QMainWindow):
@@ -47,6 +46,8 @@ class MainWindow(QMainWindow):
         """Select a CSV and open Dashboard directly"""
         file, _ = QFileDialog.getOpenFileName(self, "Open CSV File", "", "CSV Files (*.csv)")
         if file:
+            # Imported on first use: the dashboard pulls in pandas, pyarrow and plotly
+            from app.gui_dash import MFTAnalyzer as DashboardPage
             self.dashboard = DashboardPage(csv_file=file)
             self.dashboard.show()
         else: